@@ -0,0 +1,129 @@
+import logging
+import os
+import shutil
+import subprocess
+from typing import Annotated
+
+import typer
+
+from reggie_build import pyproject, workspace
+
+"""
+Utilities for removing build artifacts from a uv workspace.
+
+Provides a command to delete generated directories such as __pycache__,
+.venv, dist, build, and *.egg-info trees across the workspace.
+"""
+
+LOG = logging.getLogger(__name__)
+
+# Directory names that are always build artifacts, wherever they appear
+_KILL_NAMES = frozenset({"__pycache__"})
+# Directory names that are artifacts only at a project root; a source
+# package may legitimately be named build or dist elsewhere
+_PROJECT_KILL_NAMES = frozenset({"build", "dist"})
+
+app = typer.Typer()
+
+
+@app.command("build-artifacts")
+def build_artifacts(
+    dry_run: Annotated[
+        bool,
+        typer.Option(help="Log matched directories without deleting them."),
+    ] = False,
+) -> None:
+    """
+    Remove build artifact directories from the workspace.
+
+    Walks the workspace root with os.scandir and prunes matched directories
+    without descending into them, so large artifact trees cost a single
+    directory entry rather than a full traversal. build and dist are only
+    removed next to a pyproject.toml, and the workspace root virtual
+    environment is preserved so the active interpreter keeps working.
+    """
+    root_dir = workspace.root_dir()
+    root_venv = str(root_dir / ".venv")
+
+    def _walk(path: str) -> None:
+        try:
+            with os.scandir(path) as scan:
+                entries = list(scan)
+        except OSError as e:
+            # Skip unreadable directories instead of aborting the cleanup,
+            # matching os.walk's default error handling
+            LOG.debug("Skipping unreadable directory - path:%s error:%s", path, e)
+            return
+        # The listing already in hand decides whether this is a project
+        # root, so the scoped names cost no extra stat
+        project_root = any(entry.name == pyproject.FILE_NAME for entry in entries)
+        for entry in entries:
+            # DirEntry caches the file type from the directory read, so this
+            # does not stat() on most platforms
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if _is_artifact(entry, root_venv, project_root):
+                LOG.info("Matched build artifact: %s", entry.path)
+                matched.append(entry.path)
+                continue
+            if not entry.name.startswith("."):
+                _walk(entry.path)
+
+    matched: list[str] = []
+    _walk(str(root_dir))
+    if matched and not dry_run:
+        _fast_rmtree(matched)
+
+
+def _is_artifact(entry: os.DirEntry, root_venv: str, project_root: bool) -> bool:
+    """
+    Return True if a directory entry is a build artifact to delete.
+
+    A single module-level predicate so the walk performs one function call
+    and a couple of frozenset membership tests per directory instead of
+    sweeping a list of matcher lambdas.
+    """
+    name = entry.name
+    if name in _KILL_NAMES:
+        return True
+    if name in _PROJECT_KILL_NAMES:
+        # Only a build/dist sibling of a pyproject.toml is an artifact; a
+        # source package whose import name is build or dist is kept
+        return project_root
+    if name == ".venv":
+        # Keep the root environment that is running this command
+        return entry.path != root_venv
+    return name.endswith(".egg-info")
+
+
+def _fast_rmtree(paths: list[str]) -> None:
+    """
+    Delete directory trees with the platform's native remover.
+
+    Deleting large trees such as .venv with shutil.rmtree walks every file
+    in Python; delegating to rm -rf (or rd on Windows) keeps the per-file
+    work in C. All targets are passed in a single invocation to amortize
+    the process spawn. Falls back to shutil.rmtree if the tool fails.
+    """
+    LOG.info("Removing build artifacts - count:%s", len(paths))
+    if os.name == "nt":
+        # rd accepts a single target per invocation
+        args = [["cmd", "/c", "rd", "/s", "/q", path] for path in paths]
+    else:
+        args = [["rm", "-rf", *paths]]
+    try:
+        for arg in args:
+            subprocess.run(arg, check=True)
+        return
+    except (OSError, subprocess.CalledProcessError) as e:
+        LOG.debug("Native delete failed - paths:%s error:%s", paths, e)
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def main():
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,10 +15,19 @@ from typing import Annotated
 
 import typer
 
-from reggie_build import readme, workspace_create, workspace_sync
+from reggie_build import (
+    clean,
+    config,
+    openapi,
+    readme,
+    workspace_create,
+    workspace_sync,
+)
 
 app = typer.Typer()
+app.add_typer(clean.app, name="clean")
 app.add_typer(workspace_create.app, name="create")
+app.add_typer(openapi.app, name="openapi")
 app.add_typer(workspace_sync.app, name="sync")
 app.add_typer(readme.app, name="readme")
 
@@ -33,9 +42,7 @@ def _callback(
     ] = None,
 ):
     log_level_no = (
-        logging.getLevelNamesMapping().get(log_level.upper(), None)
-        if log_level
-        else None
+        config.level_names().get(log_level.upper(), None) if log_level else None
     )
     if log_level_no is not None:
         logging.root.setLevel(log_level_no)
@@ -2,7 +2,7 @@ import functools
 import logging
 import os
 import sys
-from typing import Callable, TextIO
+from typing import Callable, Mapping, TextIO
 
 """
 Configuration and logging initialization for reggie-build.
@@ -15,6 +15,47 @@ also be called manually as needed.
 LOG_LEVEL_ENV_NAME = "LOG_LEVEL"
 
 
+@functools.cache
+def level_names() -> Mapping[str, int]:
+    """
+    Return the logging level name mapping, computed once.
+
+    logging.getLevelNamesMapping() builds a fresh dict on every call.
+    """
+    return logging.getLevelNamesMapping()
+
+
+class _LevelEqualsFilter:
+    """
+    Record filter that only passes records of an exact level.
+
+    A plain class with a bound filter method avoids the per-record closure
+    call overhead of a lambda filter.
+    """
+
+    __slots__ = ("level",)
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno == self.level
+
+
+class _LevelNotEqualsFilter:
+    """
+    Record filter that rejects records of an exact level.
+    """
+
+    __slots__ = ("level",)
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno != self.level
+
+
 @functools.cache
 def init():
     """
@@ -31,17 +72,17 @@ def init():
         "%(asctime)s.%(msecs)03d | %(levelname)s | %(name)s:%(lineno)d - %(message)s"
     )
     log_level_env = os.getenv(LOG_LEVEL_ENV_NAME, "").upper()
-    log_level = logging.getLevelNamesMapping().get(log_level_env, logging.INFO)
+    log_level = level_names().get(log_level_env, logging.INFO)
 
     def _create_handler(
         stream: TextIO,
         level: int,
-        format: str,
+        fmt: str,
         filter_fn: Callable[[logging.LogRecord], bool] | None = None,
     ) -> logging.Handler:
         handler = logging.StreamHandler(stream)  # type: ignore[arg-type]
         handler.setLevel(level)
-        handler.setFormatter(logging.Formatter(format))
+        handler.setFormatter(logging.Formatter(fmt))
         if filter_fn is not None:
             handler.addFilter(filter_fn)
         return handler
@@ -51,13 +92,13 @@ def init():
             sys.stdout,
             logging.INFO,
             format_stdout,
-            lambda record: record.levelno == logging.INFO,
+            _LevelEqualsFilter(logging.INFO),
         ),
         _create_handler(
             sys.stderr,
             logging.DEBUG,
             format_stderr,
-            lambda record: record.levelno != logging.INFO,
+            _LevelNotEqualsFilter(logging.INFO),
         ),
     ]
 
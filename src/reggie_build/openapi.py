@@ -0,0 +1,344 @@
+import functools
+import hashlib
+import logging
+import os
+import pathlib
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from typing import Annotated
+from urllib.request import urlopen
+
+import typer
+
+"""
+FastAPI code generation from OpenAPI specifications.
+
+Provides a command to generate FastAPI application code from a local or
+remote OpenAPI specification using fastapi-code-generator. Generated code
+is staged in a temporary directory and synchronized into the output
+directory only when its content meaningfully changed, ignoring generator
+timestamps and quote style.
+"""
+
+LOG = logging.getLogger(__name__)
+
+try:
+    # Optional SIMD-accelerated hash; change detection does not need a
+    # cryptographic digest, only a stable one
+    from blake3 import blake3 as _content_hash
+except ImportError:
+    _content_hash = hashlib.sha256
+
+app = typer.Typer()
+
+_TIMESTAMP_LINE_RE = re.compile(rb"(?m)^\s*#\s*timestamp:.*\n?")
+_QUOTE_TABLE = bytes.maketrans(b"'", b'"')
+_DEFAULT_TEMPLATE_DIR = pathlib.Path(__file__).parent / "openapi_template"
+
+
+@app.callback(invoke_without_command=True)
+def generate(
+    input: Annotated[
+        str,
+        typer.Argument(help="Path or URL of the OpenAPI specification."),
+    ],
+    output: Annotated[
+        pathlib.Path,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Directory to write the generated application to.",
+        ),
+    ],
+    watch: Annotated[
+        bool,
+        typer.Option(help="Regenerate when the input specification changes."),
+    ] = False,
+):
+    """
+    Generate FastAPI code from an OpenAPI specification.
+
+    The code is generated into a temporary directory and synchronized into
+    the output directory only when the generated content changed.
+    """
+    resolved_input = _resolve_input_spec(input)
+    # Built once; each generation only contributes its staging directory
+    codegen_args = ["--input", str(resolved_input)]
+    if _DEFAULT_TEMPLATE_DIR.is_dir():
+        codegen_args.extend(["--template-dir", str(_DEFAULT_TEMPLATE_DIR)])
+
+    _generate(codegen_args, output)
+    if watch:
+        last_mtime = resolved_input.stat().st_mtime_ns
+        while True:
+            time.sleep(1)
+            current_mtime = resolved_input.stat().st_mtime_ns
+            if current_mtime != last_mtime:
+                last_mtime = current_mtime
+                _generate(codegen_args, output)
+
+
+def _generate(codegen_args: list[str], output: pathlib.Path):
+    """
+    Run one generation into a staging directory and synchronize the output.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        _run_codegen([*codegen_args, "--output", tmp_dir])
+        sync_generated_code(pathlib.Path(tmp_dir), output)
+
+
+def _run_codegen(args: list[str]):
+    """
+    Run fastapi-code-generator with the given codegen arguments.
+
+    Runs in-process when the package is importable, skipping a uv fork and
+    a cold interpreter plus codegen import chain per generation. Falls back
+    to uv tool run otherwise.
+    """
+    try:
+        # The codegen import chain emits deprecation warnings; suppress
+        # them here so unrelated commands keep their warnings visible
+        warnings.filterwarnings("ignore", category=DeprecationWarning)
+        from fastapi_code_generator.__main__ import app as codegen_app
+    except ImportError:
+        _run_codegen_subprocess(args)
+        return
+    LOG.debug("Running codegen in-process - args:%s", args)
+    try:
+        codegen_app(args)
+    except SystemExit as e:
+        if e.code:
+            raise RuntimeError(f"Codegen failed with exit code {e.code}") from e
+
+
+def _run_codegen_subprocess(args: list[str]):
+    """
+    Run fastapi-code-generator through uv tool run.
+    """
+    args = [
+        "uv",
+        "tool",
+        "run",
+        "--from",
+        "fastapi-code-generator",
+        "--with",
+        "click<8.2.0",
+        "--",
+        "fastapi-codegen",
+        *args,
+    ]
+    LOG.debug("Running codegen - args:%s", args)
+    proc = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if LOG.isEnabledFor(logging.INFO):
+        # One log record per pipe chunk instead of one per output line
+        while chunk := proc.stdout.read(65536):
+            LOG.info(chunk.rstrip())
+    else:
+        # Drain the pipe so the child never blocks on a full buffer
+        while proc.stdout.read(65536):
+            pass
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args)
+
+
+def sync_generated_code(input_dir: pathlib.Path, output_dir: pathlib.Path):
+    """
+    Synchronize generated code into the output directory.
+
+    Compares the freshly generated tree against the existing output using
+    normalized content hashes and applies only the files that actually
+    changed, keeping mtimes of untouched output files stable for
+    downstream tooling.
+    """
+    if not output_dir.exists():
+        # First generation: nothing to compare, just copy the tree
+        shutil.copytree(input_dir, output_dir)
+        LOG.info("Generated code created: %s", output_dir)
+        return
+    input_files = _list_files(input_dir)
+    input_set = set(input_files)
+    output_set = set(_list_files(output_dir))
+    stale = [file for file in output_set if file not in input_set]
+
+    # New files are changes outright; anything present on both sides is
+    # compared by normalized hash. A raw size difference is not a reliable
+    # signal, since timestamp-line removal is not length-preserving and a
+    # generator timestamp of a different length is exactly the churn the
+    # normalization exists to suppress.
+    changed = []
+    to_hash = []
+    for file in input_files:
+        if file not in output_set:
+            changed.append(file)
+        else:
+            to_hash.append(file)
+    if to_hash:
+        # Hashing is I/O plus a GIL-releasing hashlib update, so it scales
+        # across a thread pool
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4)) as executor:
+            input_hashes = executor.map(
+                lambda file: _hash_file(input_dir, file), to_hash
+            )
+            output_hashes = executor.map(
+                lambda file: _hash_file(output_dir, file), to_hash
+            )
+        changed.extend(
+            file
+            for file, input_hash, output_hash in zip(
+                to_hash, input_hashes, output_hashes
+            )
+            if input_hash != output_hash
+        )
+    if not changed and not stale:
+        LOG.info("Generated code unchanged: %s", output_dir)
+        return
+
+    # Apply the diff instead of recreating the whole tree
+    for file in changed:
+        destination = output_dir / file
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(input_dir / file, destination)
+    for file in stale:
+        path = output_dir / file
+        path.unlink(missing_ok=True)
+        # Drop directories left empty by the removal
+        parent = path.parent
+        while parent != output_dir:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+    # Bump the tree fingerprint so cached listings are invalidated
+    os.utime(output_dir)
+    LOG.info(
+        "Generated code updated - output:%s changed:%s stale:%s",
+        output_dir,
+        len(changed),
+        len(stale),
+    )
+
+
+def _list_files(directory: pathlib.Path) -> list[str]:
+    """
+    List files under a directory as sorted relative POSIX paths.
+    """
+    try:
+        st = os.stat(directory)
+    except OSError:
+        return []
+    return _list_files_cached(str(directory), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _list_files_cached(directory: str, mtime_ns: int, size: int) -> list[str]:
+    """
+    Enumerate files below a directory, keyed by a cheap tree fingerprint.
+
+    The fingerprint is the directory's own stat signature, which changes
+    whenever sync_generated_code replaces the output tree, so the stable
+    side of a watch iteration skips the full traversal. Bytecode caches
+    are excluded since they never affect generated output.
+    """
+    prefix_len = len(directory) + 1
+    files: list[str] = []
+    stack = [directory]
+    while stack:
+        for entry in os.scandir(stack.pop()):
+            # DirEntry caches the file type from the directory read, so no
+            # stat per entry, and __pycache__ is pruned before descent
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    stack.append(entry.path)
+            elif not entry.name.endswith(".pyc"):
+                files.append(entry.path[prefix_len:].replace(os.sep, "/"))
+    files.sort()
+    return files
+
+
+def _hash_file(directory: pathlib.Path, file: str) -> str:
+    """
+    Return the normalized content hash of a file within a directory.
+    """
+    path = directory / file
+    st = path.stat()
+    return _hash_cached(str(path), st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_cached(path: str, size: int, mtime_ns: int) -> str:
+    """
+    Compute a content hash that ignores generator noise.
+
+    Generator timestamp lines are skipped and quote style is normalized so
+    cosmetic differences between runs do not register as changes. Results
+    are cached by (path, size, mtime_ns) so files unchanged since the last
+    call cost a single stat instead of a re-hash, which keeps repeated
+    generation (notably watch mode) cheap on the stable side.
+    """
+    with open(path, "rb") as f:
+        buf = f.read()
+    buf = _TIMESTAMP_LINE_RE.sub(b"", buf)
+    buf = buf.replace(b"\\'", b'\\"').translate(_QUOTE_TABLE)
+    return _content_hash(buf).hexdigest()
+
+
+def _resolve_input_spec(value: str) -> pathlib.Path:
+    """
+    Resolve the input specification to a local file path.
+
+    Remote specifications are downloaded to a temporary file named by
+    content digest so repeated runs against the same spec reuse the
+    downloaded copy.
+    """
+    # A prefix check beats a full urlparse for the common local-path case
+    if not value.startswith(("http://", "https://")):
+        path = pathlib.Path(value)
+        if not path.is_file():
+            raise ValueError(f"Input specification not found: {path}")
+        return path
+    LOG.info("Downloading specification: %s", value)
+    # Stream to disk while hashing so the spec is never buffered in memory
+    h = hashlib.md5()
+    first = b""
+    with urlopen(value, timeout=30) as resp:
+        content_type = resp.headers.get("Content-Type", "").lower()
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".download") as tmp:
+            tmp_path = pathlib.Path(tmp.name)
+            while chunk := resp.read(65536):
+                if not first:
+                    first = chunk.lstrip()[:1]
+                h.update(chunk)
+                tmp.write(chunk)
+    # Prefer the declared content type; sniff the first byte otherwise
+    if "json" in content_type:
+        suffix = ".json"
+    elif "yaml" in content_type or "yml" in content_type:
+        suffix = ".yaml"
+    else:
+        suffix = ".json" if first in (b"{", b"[") else ".yaml"
+    spec_path = pathlib.Path(tempfile.gettempdir()) / f"openapi_{h.hexdigest()}{suffix}"
+    if spec_path.exists():
+        tmp_path.unlink()
+    else:
+        os.replace(tmp_path, spec_path)
+    return spec_path
+
+
+def main():
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
-import filecmp
+import functools
+import hashlib
 import logging
+import os
 import pathlib
-import shutil
+import stat
 import subprocess
+import tomllib
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from tempfile import NamedTemporaryFile
-from typing import Mapping
+from typing import Collection, Iterator, Mapping
 from urllib.parse import urlparse
 
 import tomlkit
@@ -22,6 +27,12 @@ pyproject.toml files, including reading, updating, and persisting changes
 while preserving formatting using tomlkit.
 """
 
+try:
+    # Optional Rust-backed parser for the read-only path
+    import rtoml as _rtoml
+except ImportError:
+    _rtoml = None
+
 LOG = logging.getLogger(__name__)
 FILE_NAME = "pyproject.toml"
 _MAX_BLANK_LINES = 1
@@ -72,12 +83,43 @@ class PyProject:
     using tomlkit for round-trip compatibility and taplo for formatting.
     """
 
+    _instances: "weakref.WeakValueDictionary[pathlib.Path, PyProject]" = (
+        weakref.WeakValueDictionary()
+    )
+
+    def __new__(cls, path: pathlib.Path):
+        file_path = _file_path(path)
+        if not file_path.is_absolute():
+            # Key the cache on the absolute form so relative and absolute
+            # spellings of one file intern to the same instance
+            file_path = file_path.absolute()
+        instance = cls._instances.get(file_path, None)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.path = file_path
+            instance._data = None
+            instance._raw = None
+            instance._source_hash = None
+            instance._dirty = False
+            instance._table_cache = {}
+            cls._instances[file_path] = instance
+        return instance
+
     def __init__(self, path: pathlib.Path):
         """
         Initialize a PyProject instance.
+
+        Instances are interned per file path in __new__, so two objects
+        never hold divergent documents for the same file and repeated
+        construction reuses any already-loaded state. The weak cache lets
+        unreferenced instances go away with their documents.
         """
-        self.path = _file_path(path)
-        self._data: TOMLDocument | None = None
+        self.path: pathlib.Path
+        self._data: TOMLDocument | None
+        self._raw: dict | None
+        self._source_hash: bytes | None
+        self._dirty: bool
+        self._table_cache: dict[tuple[str, ...], TableNode]
 
     @property
     def data(self) -> TOMLDocument:
@@ -86,10 +128,59 @@ class PyProject:
         """
         if self._data is None:
             LOG.debug("Reading: %s", self.path)
-            with self.path.open("rb") as f:
-                self._data = tomlkit.load(f)
+            # Keep a digest of the source so persist can recognize a no-op
+            # dump without holding the full text per project
+            text = self.path.read_text()
+            self._source_hash = _text_hash(text)
+            self._data = tomlkit.loads(text)
         return self._data
 
+    @property
+    def raw(self) -> dict:
+        """
+        Lazily load a read-only view of the pyproject.toml file.
+
+        Parsed with the stdlib tomllib, which is far cheaper than the
+        round-trip tomlkit parse behind data. Use this on code paths that
+        only inspect values; mutations must go through data so formatting
+        is preserved on persist.
+        """
+        if self._raw is None:
+            self._raw = _load_raw(self.path)
+        return self._raw
+
+    @property
+    def dirty(self) -> bool:
+        """
+        True when the loaded document has unpersisted modifications.
+        """
+        return self._dirty
+
+    def mark_dirty(self):
+        """
+        Record that the loaded document has been modified.
+
+        Call sites that mutate data should mark the project so persist can
+        skip the dump-and-compare for documents nobody touched. A spurious
+        mark is harmless; the content comparison still guards the write.
+        """
+        self._dirty = True
+
+    def value(self, *keys: str, default=None):
+        """
+        Return a nested value from the read-only view.
+
+        Replaces chained .get(..., {}) lookups; returns default as soon as
+        a segment is missing or is not a table. Mutations must still go
+        through data.
+        """
+        cur = self.raw
+        for key in keys:
+            if not isinstance(cur, Mapping) or key not in cur:
+                return default
+            cur = cur[key]
+        return cur
+
     def persist(
         self, destination_path: pathlib.Path = None, force_format: bool = False
     ) -> bool:
@@ -103,24 +194,47 @@ class PyProject:
             destination_path = self.path
         else:
             destination_path = _file_path(destination_path)
+            # Exports may target a directory that does not exist yet; the
+            # in-place path never needs this since the file was read from it
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
         if data := self._data:
+            if destination_path == self.path:
+                if not self._dirty:
+                    # Loaded but never mutated; nothing to dump or compare
+                    LOG.debug("Persist skipped, not modified: %s", destination_path)
+                    self._reset()
+                    return False
+                if (
+                    self._source_hash is not None
+                    and _text_hash(tomlkit.dumps(data)) == self._source_hash
+                ):
+                    # The document round-trips to exactly what was read, so
+                    # the temp file, taplo run and comparison are all no-ops
+                    LOG.debug("Persist skipped, unchanged: %s", destination_path)
+                    self._reset()
+                    return False
             LOG.debug("Persisting: %s", destination_path)
+            # Staging next to the destination keeps the final rename on one
+            # filesystem: os.replace is then atomic, where moving from the
+            # system temp dir could degrade to a copy across devices
             temp_path = pathlib.Path(
-                NamedTemporaryFile(delete=False, suffix=".toml").name
+                NamedTemporaryFile(
+                    delete=False, dir=destination_path.parent, suffix=".toml"
+                ).name
             )
             mod = False
             try:
                 with temp_path.open("w") as f:
                     tomlkit.dump(data, f)
                 _format(temp_path)
-                diff = not filecmp.cmp(temp_path, destination_path, shallow=False)
+                diff = _files_differ(temp_path, destination_path)
                 if diff:
-                    shutil.move(temp_path, destination_path)
+                    os.replace(temp_path, destination_path)
                     mod = True
             finally:
                 if not mod:
                     temp_path.unlink()
-            self._data = None
+            self._reset()
             return mod
         elif force_format:
             mtime = destination_path.stat().st_mtime
@@ -129,12 +243,28 @@ class PyProject:
         else:
             return False
 
+    def _reset(self):
+        """
+        Drop the loaded document state after a persist settles it.
+        """
+        self._data = None
+        self._raw = None
+        self._source_hash = None
+        self._dirty = False
+        self._table_cache.clear()
+
     def table(self, *keys: str, create: bool = False) -> TableNode | None:
         """
         Navigate to a specific table in the TOML hierarchy.
 
-        Optionally creates the table path if it doesn't exist.
+        Optionally creates the table path if it doesn't exist. Successful
+        lookups are cached per key path; a create call can restructure the
+        hierarchy, so it drops the cache.
         """
+        if create:
+            self._table_cache.clear()
+        elif (cached := self._table_cache.get(keys)) is not None:
+            return cached
         cur_node = TableNode(self.data)
         for key in keys:
             cur_table = cur_node.table
@@ -146,9 +276,15 @@ class PyProject:
                         cur_table.remove(key)
                     else:
                         cur_table.add(key, value)
+                    # Inserting the table already mutates the document, so
+                    # the class's own mutator upholds the dirty contract it
+                    # imposes on callers
+                    self.mark_dirty()
                 else:
                     return None
             cur_node = TableNode(value, _parent_entry=(cur_node, key))
+        if not create:
+            self._table_cache[keys] = cur_node
         return cur_node
 
     def __repr__(self):
@@ -172,11 +308,23 @@ class PyProjectTree:
     filtered: bool = field(default=False, init=False)
     members: dict[str, PyProject] = field(default_factory=dict)
 
-    def projects(self) -> list[PyProject]:
+    def projects(self) -> Iterator[PyProject]:
         """
-        Return a list of all projects in the tree, starting with the root.
+        Yield all projects in the tree, starting with the root.
+
+        A generator avoids materializing a throwaway list for callers
+        that only iterate, which is all of them.
         """
-        return [self.root, *self.members.values()]
+        yield self.root
+        yield from self.members.values()
+
+    def __repr__(self):
+        # The generated dataclass repr stringifies every member project;
+        # a count is enough for log lines
+        return (
+            f"{self.__class__.__name__}(name={self.name} root={self.root.path} "
+            f"members={len(self.members)} filtered={self.filtered})"
+        )
 
     def filter_members(
         self, names: list[str] | None, required: bool = False
@@ -224,6 +372,14 @@ def tree(metadata: workspace.Metadata | None = None) -> PyProjectTree:
             continue
         member_projs[member.name] = PyProject(member.path)
     root_proj: PyProject = PyProject(metadata.workspace_root)
+    if len(member_projs) > 2:
+        # Warm the lazy loads in parallel; the file reads release the GIL,
+        # so parses overlap with I/O instead of serializing on first access.
+        # The root is included since every sync touches it, and the pool is
+        # sized to the workload instead of the default cpu-derived count
+        projs = [root_proj, *member_projs.values()]
+        with ThreadPoolExecutor(max_workers=min(32, len(projs))) as executor:
+            list(executor.map(lambda proj: proj.data, projs))
     return PyProjectTree(
         name=root_proj_name or _git_repo_name(root_proj.path) or root_proj.path.name,
         root=root_proj,
@@ -235,8 +391,22 @@ def _git_repo_name(path: pathlib.Path) -> str | None:
     """
     Attempt to determine the git repository name from the origin remote URL.
     """
-    args = ["git", "remote", "get-url", "origin"]
     cwd = path.parent if path.is_file() else path
+    return _git_repo_name_cached(cwd)
+
+
+@functools.lru_cache(maxsize=None)
+def _git_repo_name_cached(cwd: pathlib.Path) -> str | None:
+    """
+    Cached per directory; the remote URL is stable for a process lifetime.
+    """
+    args = ["git", "remote", "get-url", "origin"]
+    # Outside a repo the fork only exists to fail; a walk up the tree for
+    # a .git entry (a directory, or a file for worktrees and submodules)
+    # rules that out without spawning git
+    if not any((parent / ".git").exists() for parent in (cwd, *cwd.parents)):
+        LOG.debug("No git repo above: %s", cwd)
+        return None
     try:
         proc = subprocess.run(
             args, cwd=cwd, check=False, text=True, capture_output=True
@@ -266,9 +436,63 @@ def _git_repo_name(path: pathlib.Path) -> str | None:
     return None
 
 
-def _format(path: pathlib.Path):
+def _load_raw(path: pathlib.Path) -> dict:
+    """
+    Parse a TOML file for read-only use with the fastest available backend.
+
+    Results are cached by (path, size, mtime_ns) so an unchanged file is
+    parsed once per process; the returned dict is shared and must not be
+    mutated, which the raw property already requires.
+    """
+    st = os.stat(path)
+    return _load_raw_cached(str(path), st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_raw_cached(path: str, size: int, mtime_ns: int) -> dict:
+    if _rtoml is not None:
+        return _rtoml.load(pathlib.Path(path))
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _text_hash(text: str) -> bytes:
+    """
+    Digest used to fingerprint a document's serialized form.
+    """
+    return hashlib.blake2b(text.encode()).digest()
+
+
+def _files_differ(a: pathlib.Path, b: pathlib.Path) -> bool:
+    """
+    Compare two files by size, then content.
+
+    pyproject files are small, so after the size fast-reject a single
+    read_bytes comparison beats filecmp's chunked loop. A missing or
+    unreadable side counts as a difference.
+    """
+    try:
+        if a.stat().st_size != b.stat().st_size:
+            return True
+        return a.read_bytes() != b.read_bytes()
+    except OSError:
+        return True
+
+
+def format_files(paths: Collection[pathlib.Path]):
     """
-    Apply taplo formatting to a TOML file with workspace-specific options.
+    Apply taplo formatting to a collection of TOML files in one invocation.
+    """
+    if paths:
+        _format(*paths)
+
+
+def _format(*paths: pathlib.Path):
+    """
+    Apply taplo formatting to TOML files with workspace-specific options.
+
+    taplo accepts any number of files per run, so callers with several
+    targets pay one process spawn instead of one per file.
     """
     fmt_stdout = subprocess.check_output(
         [
@@ -278,7 +502,7 @@ def _format(path: pathlib.Path):
             f"allowed_blank_lines={_MAX_BLANK_LINES}",
             "--option",
             f"indent_string={_INDENT}",
-            str(path.absolute()),
+            *[str(path.absolute()) for path in paths],
         ],
         text=True,
         stderr=subprocess.STDOUT,
@@ -288,11 +512,21 @@ def _format(path: pathlib.Path):
 
 def _file_path(path: pathlib.Path) -> pathlib.Path:
     """
-    Normalize a path to a pyproject.toml file, creating parent directories if needed.
+    Normalize a path to a pyproject.toml file.
+
+    Purely a path computation; persist creates missing destination
+    directories when it actually writes.
     """
-    if path.is_dir():
+    # Paths ending in the canonical file name need no stat at all
+    if path.name == FILE_NAME:
+        return path
+    # One stat covers both the is_dir and existence questions
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        mode = None
+    if mode is not None and stat.S_ISDIR(mode):
         return path / FILE_NAME
-    path.parent.mkdir(parents=True, exist_ok=True)
     return path
 
 
@@ -9,15 +9,17 @@ Supports parallel execution, smart help filtering, and selective updates.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
 import shlex
 import subprocess
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from multiprocessing import cpu_count
 from pathlib import Path
-from typing import Pattern
+from typing import Iterator, Pattern
 
 import typer
 
@@ -27,22 +29,112 @@ LOG = logging.getLogger(__name__)
 
 app = typer.Typer(help="Update README command sentinel blocks.")
 
-# Sentinel regex (generic)
-_CMD_BLOCK_RE = re.compile(
-    r"""
-    \s*<!--\s*BEGIN:cmd\s+(?P<cmd>[^>]+?)\s*-->\s*
-    (?P<body>.*?)
-    \s*<!--\s*END:cmd\s*-->\s*
-    """,
-    re.DOTALL | re.VERBOSE,
-)
+# Sentinel tokens; blocks are located with str.find rather than a DOTALL
+# regex so large documents are traversed by the C substring search
+_BEGIN_TOKEN = "BEGIN:cmd"
+_END_TOKEN = "END:cmd"
+
 
+@dataclass(frozen=True)
+class _CmdBlock:
+    """
+    Span of one command sentinel block, including surrounding whitespace.
+    """
 
-_HELP_OPTIONS_HEADER_RE = re.compile(r"\bOptions\b.*[-─]")
-_HELP_OPTIONS_FOOTER_RE = re.compile(r"^\s*[-─╰╯]+")
-_HELP_OPTIONS_HELP_ROW_RE = re.compile(r"^\s*[│|]?\s*--help\b")
+    start: int
+    end: int
+    cmd: str
+
+
+def _iter_cmd_blocks(content: str) -> Iterator[_CmdBlock]:
+    """
+    Scan for command sentinel blocks.
+
+    Matches <!-- BEGIN:cmd ... --> through the next well-formed
+    <!-- END:cmd --> and widens each span over the surrounding
+    whitespace, which is what lets replacements normalize block
+    spacing. Equivalent to the previous regex scan without its
+    character-by-character backtracking.
+    """
+    begin_len = len(_BEGIN_TOKEN)
+    last_end = 0
+    pos = 0
+    while (token := content.find(_BEGIN_TOKEN, pos)) != -1:
+        pos = token + begin_len
+        opener = content.rfind("<!--", last_end, token)
+        if opener == -1 or content[opener + 4 : token].strip():
+            continue
+        begin_close = content.find("-->", token)
+        if begin_close == -1:
+            return
+        if not content[token + begin_len : token + begin_len + 1].isspace():
+            continue
+        cmd = content[token + begin_len : begin_close].strip()
+        if not cmd or ">" in cmd:
+            continue
+        end = _find_end_sentinel(content, begin_close + 3)
+        if end is None:
+            # No well-formed END remains, so no later BEGIN can close either
+            return
+        start = opener
+        while start > last_end and content[start - 1].isspace():
+            start -= 1
+        while end < len(content) and content[end].isspace():
+            end += 1
+        yield _CmdBlock(start=start, end=end, cmd=cmd)
+        last_end = end
+        pos = end
+
+
+def _find_end_sentinel(content: str, pos: int) -> int | None:
+    """
+    Return the index just past the first well-formed END sentinel.
+    """
+    end_len = len(_END_TOKEN)
+    while (token := content.find(_END_TOKEN, pos)) != -1:
+        pos = token + end_len
+        opener = content.rfind("<!--", 0, token)
+        if opener == -1 or content[opener + 4 : token].strip():
+            continue
+        close = content.find("-->", token)
+        if close == -1:
+            return None
+        if content[token + end_len : close].strip():
+            continue
+        return close + 3
+    return None
+
+
+# One alternation classifies a help line in a single scan; dispatch on
+# match.lastgroup instead of running three separate regexes per line
+_HELP_LINE_RE = re.compile(
+    r"(?P<header>\bOptions\b.*[-─])"
+    r"|(?P<footer>^\s*[-─╰╯]+)"
+    r"|(?P<help_row>^\s*[│|]?\s*--help\b)"
+)
 _CODE_BLOCK_RE = re.compile(r"^([`~]{3,}).*?^\1", re.MULTILINE | re.DOTALL)
 
+# Commands containing any of these need shell interpretation: pipes,
+# redirection, chaining, substitution, grouping, comments, globs and
+# expansions. A VAR=value first token is also shell syntax; see _run_cmd
+_SHELL_META_CHARS = (
+    "|",
+    ">",
+    "<",
+    "&",
+    ";",
+    "$",
+    "*",
+    "?",
+    "~",
+    "`",
+    "[",
+    "{",
+    "(",
+    ")",
+    "#",
+)
+
 
 @app.callback(invoke_without_command=True)
 def update_cmd(
@@ -60,16 +152,22 @@ def update_cmd(
         help="Write changes back to the README file.",
     ),
     jobs: int = typer.Option(
-        max(1, cpu_count() - 1),
+        min(32, (cpu_count() or 1) * 4),
         "--jobs",
         "-j",
         help="Maximum number of parallel commands.",
     ),
-    filter: str = typer.Option(
+    filter_pattern: str = typer.Option(
         None,
         "--filter",
         help="Regex to select which BEGIN:cmd blocks to update.",
     ),
+    cache_dir: Path = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for cached command output, keyed by command hash.",
+        file_okay=False,
+    ),
 ):
     """
     Update README command sentinel blocks.
@@ -88,20 +186,24 @@ def update_cmd(
         return any(start <= pos < end for start, end in code_ranges)
 
     block_matches = [
-        m for m in _CMD_BLOCK_RE.finditer(content) if not is_in_code_block(m.start())
+        b for b in _iter_cmd_blocks(content) if not is_in_code_block(b.start)
     ]
     if not block_matches:
         LOG.info("No cmd blocks found")
         return
 
-    filter_re: Pattern[str] | None = re.compile(filter) if filter else None
+    filter_re: Pattern[str] | None = (
+        re.compile(filter_pattern) if filter_pattern else None
+    )
 
     selected_cmds: list[str] = []
-    for m in block_matches:
-        cmd = m.group("cmd")
-        if filter_re and not filter_re.search(cmd):
+    for b in block_matches:
+        if filter_re and not filter_re.search(b.cmd):
             continue
-        selected_cmds.append(cmd)
+        selected_cmds.append(b.cmd)
+    # A command appearing in several blocks only needs to run once; every
+    # block shares the one output. dict.fromkeys dedupes preserving order
+    selected_cmds = list(dict.fromkeys(selected_cmds))
 
     if not selected_cmds:
         LOG.info("No cmd blocks matched filter")
@@ -116,24 +218,52 @@ def update_cmd(
 
     output_map: dict[str, str] = {}
 
-    with ProcessPoolExecutor(max_workers=jobs) as executor:
-        futures = {executor.submit(_run_cmd, cmd): cmd for cmd in selected_cmds}
-
-        for future in as_completed(futures):
-            cmd, output = future.result()
+    to_run = selected_cmds
+    if cache_dir:
+        # Opt-in cache: commands whose output is already on disk are not
+        # run at all. The cache key is the command text only, so it is the
+        # caller's job to clear the directory when the tools change
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        to_run = []
+        for cmd in selected_cmds:
+            cache_path = _cache_path(cache_dir, cmd)
+            if cache_path.is_file():
+                output_map[cmd] = cache_path.read_text()
+            else:
+                to_run.append(cmd)
+        if len(to_run) != len(selected_cmds):
+            LOG.info(
+                "Cached cmd blocks - hits:%s misses:%s",
+                len(selected_cmds) - len(to_run),
+                len(to_run),
+            )
+
+    # The workers only wait on subprocesses, so threads parallelize just as
+    # well without forking an interpreter per worker
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # map drops the futures dict and as_completed bookkeeping; results
+        # land in a dict, so completion order is irrelevant. chunksize only
+        # applies to process pools
+        for cmd, output in executor.map(_run_cmd, to_run):
             output_map[cmd] = output
-
-    def _replace(match: re.Match) -> str:
-        """Replace sentinel block content with executed command output."""
-        if is_in_code_block(match.start()):
-            return match.group(0)
-
-        cmd = match.group("cmd")
-        if cmd not in output_map:
-            return match.group(0)  # untouched
-        return f"\n\n<!-- BEGIN:cmd {cmd} -->\n{output_map[cmd]}\n<!-- END:cmd -->\n\n"
-
-    updated = _CMD_BLOCK_RE.sub(_replace, content)
+            if cache_dir:
+                _cache_path(cache_dir, cmd).write_text(output)
+
+    # Rebuild from the matches already found instead of re-scanning the
+    # whole document with sub(); blocks inside code fences never made it
+    # into block_matches, so they pass through with the surrounding text
+    parts: list[str] = []
+    last_end = 0
+    for b in block_matches:
+        if b.cmd not in output_map:
+            continue
+        parts.append(content[last_end : b.start])
+        parts.append(
+            f"\n\n<!-- BEGIN:cmd {b.cmd} -->\n{output_map[b.cmd]}\n<!-- END:cmd -->\n\n"
+        )
+        last_end = b.end
+    parts.append(content[last_end:])
+    updated = "".join(parts)
 
     if updated == content:
         LOG.info("No changes detected")
@@ -142,11 +272,22 @@ def update_cmd(
     LOG.info("README command blocks updated")
 
     if write:
-        readme.write_text(updated)
+        # Stage next to the destination and swap atomically so a crash
+        # mid-write can never leave a truncated README
+        temp_path = readme.with_suffix(readme.suffix + ".tmp")
+        temp_path.write_text(updated)
+        os.replace(temp_path, readme)
     else:
         LOG.info("README update: %s", updated)
 
 
+def _cache_path(cache_dir: Path, cmd: str) -> Path:
+    """
+    Return the cache file for a command's rendered output.
+    """
+    return cache_dir / hashlib.blake2s(cmd.encode()).hexdigest()
+
+
 def _run_cmd(cmd: str) -> tuple[str, str]:
     """
     Execute command and capture output in markdown code block format.
@@ -164,61 +305,90 @@ def _run_cmd(cmd: str) -> tuple[str, str]:
     args = shlex.split(cmd)
     has_help = "--help" in args
     LOG.debug("Running cmd block - args:%s has_help:%s", args, has_help)
-    env = os.environ.copy().update(
-        {config.LOG_LEVEL_ENV_NAME: logging.getLevelName(logging.ERROR)}
-    )
-    proc = subprocess.run(
-        cmd,
-        shell=True,
-        check=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        env=env,
+    env = os.environ.copy()
+    env[config.LOG_LEVEL_ENV_NAME] = logging.getLevelName(logging.ERROR)
+    # The command is already split; executing the argv directly skips the
+    # intermediate shell process per block. Commands using shell syntax
+    # (pipes, redirection, chaining) still get a real shell
+    needs_shell = (
+        any(meta in cmd for meta in _SHELL_META_CHARS)
+        # A leading VAR=value assignment is shell syntax, not a program name
+        or "=" in args[0]
     )
-
     if has_help:
-        lines = proc.stdout.splitlines()
-
-        out: list[str] = []
-        options_block: list[str] = []
-        in_options = False
-
-        for line in lines:
-            if _HELP_OPTIONS_HEADER_RE.search(line):
-                in_options = True
-                options_block = [line]
-                continue
-
-            if in_options:
-                options_block.append(line)
-
-                if _HELP_OPTIONS_FOOTER_RE.match(line):
-                    has_real_options = any(
-                        not _HELP_OPTIONS_HELP_ROW_RE.search(opt_line)
-                        and not _HELP_OPTIONS_HEADER_RE.search(opt_line)
-                        and not _HELP_OPTIONS_FOOTER_RE.match(opt_line)
-                        and opt_line.strip()
-                        for opt_line in options_block
-                    )
+        # Stream the pipe straight into the filter state machine instead
+        # of buffering the whole output and a parallel list of lines
+        with subprocess.Popen(
+            cmd if needs_shell else args,
+            shell=needs_shell,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            env=env,
+        ) as proc:
+            output = "\n".join(_filter_help_lines(proc.stdout))
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, args)
+    else:
+        proc = subprocess.run(
+            cmd if needs_shell else args,
+            shell=needs_shell,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            env=env,
+        )
+        output = proc.stdout
 
-                    if has_real_options:
-                        for opt_line in options_block:
-                            if not _HELP_OPTIONS_HELP_ROW_RE.search(opt_line):
-                                out.append(opt_line)
+    return cmd, f"```shell\n{output.strip()}\n```"
 
-                    options_block = []
-                    in_options = False
 
-                continue
+def _filter_help_lines(lines) -> list[str]:
+    """
+    Filter --help output, dropping the --help row and empty Options boxes.
 
-            out.append(line)
+    Accepts any iterable of lines, so a subprocess pipe can feed it while
+    the child is still writing.
+    """
+    out: list[str] = []
+    # Each buffered line keeps its classification so the footer handling
+    # never re-runs the regex, and real option rows are counted as they
+    # arrive instead of re-scanned
+    options_block: list[tuple[str, str | None]] = []
+    real_options = 0
+    in_options = False
+
+    for line in lines:
+        line = line.rstrip("\n")
+        m = _HELP_LINE_RE.search(line)
+        kind = m.lastgroup if m else None
+        if kind == "header":
+            in_options = True
+            options_block = [(line, kind)]
+            real_options = 0
+            continue
 
-        output = "\n".join(out)
-    else:
-        output = proc.stdout
+        if in_options:
+            options_block.append((line, kind))
+            if kind is None and line.strip():
+                real_options += 1
+
+            if kind == "footer":
+                if real_options:
+                    out.extend(
+                        opt_line
+                        for opt_line, opt_kind in options_block
+                        if opt_kind != "help_row"
+                    )
+                options_block = []
+                in_options = False
 
-    return cmd, f"```shell\n{output.strip()}\n```"
+            continue
+
+        out.append(line)
+
+    return out
 
 
 def main():
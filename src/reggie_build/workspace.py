@@ -38,7 +38,10 @@ class MetadataMember:
 def metadata(path: pathlib.Path = None) -> Metadata:
     if path is None:
         path = pathlib.Path().cwd()
-    return _metadata(path.absolute())
+    elif not path.is_absolute():
+        # Only normalize relative paths; absolute ones key the cache as-is
+        path = path.absolute()
+    return _metadata(path)
 
 
 @functools.lru_cache(maxsize=None)
@@ -81,7 +84,7 @@ def root_dir() -> pathlib.Path:
 
 
 if __name__ == "__main__":
-    root = pathlib.Path(root_dir()).parent / "reggie-bricks-py"
+    root = root_dir().parent / "reggie-bricks-py"
     root = root_dir()
 
     SKIP = {".venv", "__pycache__", "build", "dist"}
@@ -3,7 +3,6 @@ import os
 import pathlib
 from typing import Annotated
 
-import tomlkit
 import typer
 
 from reggie_build import pyproject, workspace, workspace_sync
@@ -71,31 +70,30 @@ def create(
     project_dir.mkdir(parents=True, exist_ok=True)
     LOG.info("Creating member project: %s", project_dir)
 
-    # Initialize pyproject.toml
-    pyproject_data = {
-        "project": {
-            "name": name,
-            "version": "0",
-            "requires-python": ">=3.6",
-        },
-    }
+    # Initialize pyproject.toml. The file shape is fixed and freshly
+    # created, so it is emitted directly instead of through tomlkit's
+    # round-trip machinery; the post-create sync formats it with taplo.
+    lines = [
+        "[project]",
+        f'name = "{name}"',
+        'version = "0"',
+        'requires-python = ">=3.6"',
+    ]
     pyproject_tree = pyproject.tree(metadata=metadata)
     if project_dependencies:
-        # Add project dependencies as a multiline TOML array
-
-        deps = tomlkit.array()
-        deps.multiline(True)
-        project_tree_names = [
-            pyproject_tree.name,
-            *pyproject_tree.members.keys(),
-        ]
+        # frozenset membership instead of a list scan per dependency
+        project_tree_names = frozenset(
+            (pyproject_tree.name, *pyproject_tree.members.keys())
+        )
         for dep in project_dependencies:
             if dep not in project_tree_names:
                 raise ValueError(f"Invalid project dependency: {dep}")
-            deps.append(dep)
-        pyproject_data["project"]["dependencies"] = deps
+        # Add project dependencies as a multiline TOML array
+        lines.append("dependencies = [")
+        lines.extend(f'    "{dep}",' for dep in project_dependencies)
+        lines.append("]")
 
-    pyproject_path.write_text(tomlkit.dumps(pyproject_data))
+    pyproject_path.write_text("\n".join(lines) + "\n")
 
     # Create the standard Python src layout and an __init__.py file
     package_dir = project_dir / "src" / name.replace("-", "_")
@@ -1,14 +1,17 @@
+import fnmatch
+import functools
 import logging
 import os
 import pathlib
 import re
+import shutil
 import subprocess
 from collections import defaultdict
-from copy import deepcopy
-from typing import Annotated, Collection
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Iterable
 
+import tomlkit
 import typer
-from mergedeep import merge
 
 from reggie_build import pyproject
 from reggie_build.pyproject import PyProject, PyProjectTree
@@ -22,6 +25,10 @@ and dependencies across the root project and its member projects.
 
 LOG = logging.getLogger(__name__)
 
+# Matches "name @ file://..." dependency specifiers; compiled once instead
+# of inside the per-dependency parse
+_DEP_NAME_RE = re.compile(r"^\s*([\w\-\.\[\]]+)\s*@\s*file://")
+
 app = typer.Typer()
 
 
@@ -106,23 +113,46 @@ def sync(
         sync_member_paths(unfiltered_pyproject_tree)
     if format_python:
         ruff_format(pyproject_tree.projects())
+    persist_paths: list[pathlib.Path] = []
+    persist_jobs: list[tuple[str, PyProject, pathlib.Path | None]] = []
     for proj_name, proj in {
         pyproject_tree.name: pyproject_tree.root,
         **pyproject_tree.members,
     }.items():
         destination_path = output_dir / proj.path if output_dir else None
-        if proj.persist(
-            destination_path=destination_path,
-            force_format=format_pyproject,
-        ):
+        persist_paths.append(destination_path or proj.path)
+        if destination_path is None and not proj.dirty:
+            # In-place save of an untouched document; persist would only
+            # re-derive the same conclusion
+            continue
+        persist_jobs.append((proj_name, proj, destination_path))
+
+    def _persist(job: tuple[str, PyProject, pathlib.Path | None]):
+        proj_name, proj, destination_path = job
+        if proj.persist(destination_path=destination_path):
             LOG.info(
                 "Project updated - name:%s path:%s",
                 proj_name,
                 destination_path or proj.path,
             )
 
+    if len(persist_jobs) > 4:
+        # Each persist forks taplo and waits on it; with several projects
+        # the forks overlap in a thread pool. Instances are distinct per
+        # file, so there is no shared document state between jobs
+        with ThreadPoolExecutor(max_workers=min(32, len(persist_jobs))) as executor:
+            list(executor.map(_persist, persist_jobs))
+    else:
+        for job in persist_jobs:
+            _persist(job)
+    if format_pyproject:
+        # One taplo run over every file beats a fork per project; persist
+        # already writes formatted output, so this only reformats files it
+        # left untouched and is idempotent on the rest
+        pyproject.format_files(persist_paths)
+
 
-def sync_version(projs: Collection[PyProject], version: str | None = None):
+def sync_version(projs: Iterable[PyProject], version: str | None = None):
     """
     Update the version field in the [project] table for a collection of projects.
 
@@ -139,6 +169,7 @@ def sync_version(projs: Collection[PyProject], version: str | None = None):
             if current_version == version:
                 continue
             project_data[key] = version
+            proj.mark_dirty()
             LOG.debug(
                 "Updated version - key:%s proj:%s version:%s previous_version:%s",
                 key,
@@ -156,22 +187,17 @@ def _version():
     (or HEAD~1 if the working directory is modified).
     """
     git_status_args = ["git", "status", "--porcelain"]
-    proc = subprocess.Popen(
+    proc = subprocess.run(
         git_status_args,
         stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
-        bufsize=1,
         text=True,
     )
-    modified = False
-    for line in proc.stdout:
-        line = line.strip()
-        if line:
-            LOG.debug("Git status - args:%s line:%s", git_status_args, line)
-            modified = True
-            break
-    proc.terminate()
-    proc.wait()
+    # Any porcelain output means the working tree is modified; no need to
+    # iterate lines or tear down a pipe mid-stream
+    modified = bool(proc.stdout.strip())
+    if modified:
+        LOG.debug("Git status - args:%s modified:%s", git_status_args, modified)
     head_arg = "HEAD" if modified else "HEAD~1"
     rev_parse_args = ["git", "rev-parse", "--short", head_arg]
     rev = subprocess.check_output(rev_parse_args, text=True).strip()
@@ -184,24 +210,33 @@ def sync_build_system(pyproject_tree: PyProjectTree):
     Synchronize the [build-system] table from the root project to all member projects.
     """
     key = "build-system"
-    data = pyproject_tree.root.data.get(key, {})
+    data = pyproject_tree.root.data.get(key)
     LOG.debug("Build system - key:%s data:%s", key, data)
     if data:
+        # Dump the root table once; parsing the fragment per member yields
+        # an independent copy with the root's comments and formatting
+        # intact, which assigning a plain mapping would strip
+        fragment = tomlkit.dumps({key: data})
         for member in pyproject_tree.members.values():
-            member.data[key] = deepcopy(data)
+            member.data[key] = tomlkit.parse(fragment)[key]
+            member.mark_dirty()
 
 
 def sync_member_project_tool(pyproject_tree: PyProjectTree):
     """
     Merge the [tool.member-project] configuration from root to all member projects.
     """
-    member_project_data = pyproject_tree.root.data.get("tool", {}).get(
-        "member-project", {}
+    member_project_data = pyproject_tree.root.value(
+        "tool", "member-project", default={}
     )
     LOG.debug("Member project data: %s", member_project_data)
     if member_project_data:
+        # Imported lazily to keep CLI startup free of merge machinery
+        from mergedeep import merge
+
         for member in pyproject_tree.members.values():
             merge(member.data, member_project_data)
+            member.mark_dirty()
 
 
 def sync_member_project_dependencies(
@@ -228,15 +263,23 @@ def _sync_member_project_dependencies(pyproject_tree: PyProjectTree, proj: PyPro
     member_dependencies: list[str] = []
     dependencies = proj.data.get("project", {}).get("dependencies", [])
     if dependencies:
+        # Loop-invariant: every dependency is relative to this directory
+        proj_dir = proj.path.parent.absolute()
         for idx, dependency in enumerate(dependencies):
-            dep = _parse_dependency_name(dependencies[idx])
+            dep = _parse_dependency_name(dependency)
             dep_proj = (
                 pyproject_tree.root
                 if dep == pyproject_tree.name
                 else pyproject_tree.members.get(dep, None)
             )
             if dep_proj:
-                dependencies[idx] = _member_dependency(proj, dep, dep_proj)
+                member_dependency = _member_dependency(proj_dir, dep, dep_proj)
+                if dependency != member_dependency:
+                    # Write back only entries that actually changed; a full
+                    # rebuild is off the table since tomlkit arrays reject
+                    # slice assignment, and sparse writes keep formatting
+                    dependencies[idx] = member_dependency
+                    proj.mark_dirty()
                 member_dependencies.append(dep)
 
     sources_node = proj.table("tool", "uv", "sources", create=bool(member_dependencies))
@@ -247,6 +290,7 @@ def _sync_member_project_dependencies(pyproject_tree: PyProjectTree, proj: PyPro
             workspace_value = source_table.get(dep, {}).get(workspace_key, None)
             if workspace_value is True and dep not in member_dependencies:
                 source_table.remove(dep)
+                proj.mark_dirty()
                 LOG.debug(
                     "Removed source - key:%s proj:%s dependency:%s",
                     workspace_key,
@@ -254,9 +298,15 @@ def _sync_member_project_dependencies(pyproject_tree: PyProjectTree, proj: PyPro
                     dep,
                 )
         for member_dependency in member_dependencies:
-            source = {member_dependency: {workspace_key: True}}
-            source_table.update(source)
+            existing = source_table.get(member_dependency, None)
+            if existing is not None and existing.get(workspace_key) is True:
+                continue
+            # Direct key assignment; no wrapper dict and update() call, and
+            # no throwaway default mapping per lookup
+            source_table[member_dependency] = {workspace_key: True}
+            proj.mark_dirty()
         if sources_node.prune():
+            proj.mark_dirty()
             LOG.debug(
                 "Pruned source - key:%s proj:%s",
                 workspace_key,
@@ -271,10 +321,9 @@ def sync_member_paths(
         raise ValueError("Unfiltered workspace tree required for member path sync")
     root_proj = unfiltered_pyproject_tree.root
     workspace_key_path = ["tool", "uv", "workspace"]
-    exclude_patterns: list[str] | None = None
-    if workspace_node := root_proj.table(*workspace_key_path):
-        if exclude_item := workspace_node.table.get("exclude", None):
-            exclude_patterns = [item.value for item in exclude_item]
+    # The read-only view already yields plain strings; no table navigation
+    # or per-item value unwrapping needed
+    exclude_patterns: list[str] | None = root_proj.value(*workspace_key_path, "exclude")
     member_paths = [p.path.parent for p in unfiltered_pyproject_tree.members.values()]
     member_patterns = _workspace_member_paths(
         root_proj.path.parent,
@@ -286,12 +335,16 @@ def sync_member_paths(
     if members_key in workspace_table:
         if member_patterns:
             member_table = workspace_table[members_key]
-            member_table.clear()
-            member_table.extend(member_patterns)
+            if list(member_table) != member_patterns:
+                member_table.clear()
+                member_table.extend(member_patterns)
+                root_proj.mark_dirty()
         else:
             workspace_table.remove(members_key)
+            root_proj.mark_dirty()
     else:
         workspace_table.update({members_key: member_patterns})
+        root_proj.mark_dirty()
 
 
 def _workspace_member_paths(
@@ -314,6 +367,17 @@ def _workspace_member_paths(
     for p in original_rels:
         by_parent[p.parent].add(p)
 
+    # Compile name-only exclude patterns into one alternation up front;
+    # Path.match re-translates its pattern on every call. Patterns with a
+    # separator still need the path-aware matcher.
+    name_excludes = [ex for ex in (excludes or []) if "/" not in ex]
+    path_excludes = [ex for ex in (excludes or []) if "/" in ex]
+    name_exclude_re = (
+        re.compile("|".join(fnmatch.translate(ex) for ex in name_excludes))
+        if name_excludes
+        else None
+    )
+
     for parent, children in by_parent.items():
         if parent == pathlib.Path("."):
             LOG.debug("Skip parent=root")
@@ -325,7 +389,10 @@ def _workspace_member_paths(
             continue
 
         try:
-            fs_items = [item for item in parent_full.iterdir() if item.is_dir()]
+            # DirEntry carries the file type from the directory read, so
+            # this avoids a stat per entry
+            with os.scandir(parent_full) as entries:
+                fs_items = [entry.name for entry in entries if entry.is_dir()]
         except OSError as e:
             LOG.debug("Skip parent=%s reason=iterdir_error err=%s", parent, e)
             continue
@@ -333,19 +400,27 @@ def _workspace_member_paths(
         valid_fs_children = []
         skipped = []
 
-        for item in fs_items:
-            if item.name.startswith(".") or item.name == "__pycache__":
-                skipped.append(item.name)
+        for item_name in fs_items:
+            if item_name.startswith(".") or item_name == "__pycache__":
+                skipped.append(item_name)
+                continue
+
+            if name_exclude_re is not None and name_exclude_re.match(item_name):
+                skipped.append(item_name)
                 continue
 
-            item_rel = parent / item.name
-            if any(item_rel.match(ex) for ex in excludes):
-                skipped.append(item.name)
+            # Only build a Path when a path-aware pattern needs one; the
+            # loop otherwise stays on plain name strings
+            if path_excludes and any(
+                (parent / item_name).match(ex) for ex in path_excludes
+            ):
+                skipped.append(item_name)
                 continue
 
-            valid_fs_children.append(item_rel)
+            valid_fs_children.append(item_name)
 
-        if set(children) != set(valid_fs_children):
+        # All children share this parent, so comparing names is enough
+        if {p.name for p in children} != set(valid_fs_children):
             LOG.debug(
                 "NoCollapse parent=%s expected=%s actual=%s skipped=%s",
                 parent,
@@ -378,33 +453,35 @@ def _parse_dependency_name(dep: str) -> str | None:
     """
     Extract the project name from a dependency string, handling file:// formats.
     """
-    m = re.match(r"^\s*([\w\-\.\[\]]+)\s*@\s*file://", dep)
+    m = _DEP_NAME_RE.match(dep)
     return m.group(1) if m else dep
 
 
-def _member_dependency(member_proj: PyProject, dep: str, dep_proj: PyProject):
+def _member_dependency(member_proj_dir: pathlib.Path, dep: str, dep_proj: PyProject):
     """
     Format an internal workspace dependency as a file:// URI with PROJECT_ROOT variable.
     """
-    member_proj_dir = member_proj.path.parent.resolve(strict=False)
-    dep_proj_dir = dep_proj.path.parent.resolve(strict=False)
+    # absolute() is enough here: both paths come from the same workspace
+    # root, so the relative path is stable without resolving symlinks, and
+    # resolve() costs a readlink walk per path component
+    dep_proj_dir = dep_proj.path.parent.absolute()
     relative_path = os.path.relpath(dep_proj_dir, member_proj_dir)
     member_dependency = f"{dep} @ file://$" + "{PROJECT_ROOT}/" + str(relative_path)
     return member_dependency
 
 
-def ruff_format(projs: list[PyProject]):
+def ruff_format(projs: Iterable[PyProject]):
     """
     Execute ruff formatting and linting fixes on a collection of projects.
-    """
-    for proj in projs:
-        _ruff_format(proj.path.parent)
 
-
-def _ruff_format(path: pathlib.Path):
-    """
-    Internal helper to run ruff check and ruff format on a specific directory.
+    All project directories go to ruff in one check and one format run;
+    ruff parallelizes internally, so per-project invocations only added
+    process spawns. Passing the directories also fixes the previous
+    behavior of running ruff against the working directory per project.
     """
+    paths = [str(proj.path.parent) for proj in projs]
+    if not paths:
+        return
     check_select = ["UP007", "UP006", "F401", "I"]
     run_arg_options = {
         "check": [
@@ -414,9 +491,23 @@ def _ruff_format(path: pathlib.Path):
         ],
         "format": [],
     }
+    ruff_bin = _ruff_bin()
     for arg, options in run_arg_options.items():
-        stdout = subprocess.check_output(["ruff", arg, *options], text=True).strip()
-        LOG.debug("Ruff format - arg:%s path:%s output:%s", arg, path, stdout)
+        stdout = subprocess.check_output(
+            [ruff_bin, arg, *options, *paths], text=True
+        ).strip()
+        LOG.debug("Ruff format - arg:%s paths:%s output:%s", arg, paths, stdout)
+
+
+@functools.lru_cache(maxsize=None)
+def _ruff_bin() -> str:
+    """
+    Resolve the ruff executable once per process.
+
+    Spawning with a bare name walks PATH inside execvp on every fork;
+    resolving up front pays the stat walk a single time.
+    """
+    return shutil.which("ruff") or "ruff"
 
 
 if "__main__" == __name__: